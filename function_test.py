@@ -7,24 +7,21 @@ is listed in the file.
 
 Option is provided to clear out the txt files in a safe manner.
 """
-from collections import defaultdict
+from collections import Counter
+from itertools import islice
 
-import glob
 import re
 import os
 import uuid
 
 
 __SIGNATURE = "<scanline-test>"
-__BASENAME_PATTERN = r"([\w-]+[\D])(\d+)?$"
+__BASENAME_PATTERN = re.compile(r"([\w-]+[\D])(\d+)?$")
 
 
 def _mkdir(directory):
-    """ Private function, make directory """
-    try:
-        os.mkdir(directory)
-    except OSError:
-        return False
+    """ Private function, make directory and any missing parents """
+    os.makedirs(directory, exist_ok=True)
 
     return True
 
@@ -43,18 +40,19 @@ def _validate_basename(dirname, basename):
     # If the basename doesnt exist then we dont need to proceed to validate the version
     base_with_ext = os.path.splitext(basename)[0] + ".txt"
 
-    if not filter(lambda f: f.lower() == base_with_ext.lower(), os.listdir(dirname)):
+    if not os.path.exists(os.path.join(dirname, base_with_ext)):
         return base_with_ext
 
     # Remove the .txt if applied, all if the user applies different ext
     basename = os.path.splitext(basename)[0]
-    basename, increment = re.findall(pattern=__BASENAME_PATTERN, string=basename)[0]
+    basename, increment = __BASENAME_PATTERN.findall(basename)[0]
 
-    # Find if the files exist if so then increment version
+    # Increment the version until we find a file that doesnt exist
     increment = int(increment or 0) + 1
-    basename = "{}{}.txt".format(basename, increment)
+    while os.path.exists(os.path.join(dirname, "{}{}.txt".format(basename, increment))):
+        increment += 1
 
-    return _validate_basename(dirname, basename)
+    return "{}{}.txt".format(basename, increment)
 
 
 def clear_directory(directory, safe=False):
@@ -72,8 +70,8 @@ def clear_directory(directory, safe=False):
         True if successful
     """
     # Find the txt files in the directory
-    expr = os.path.join(directory, "*.txt")
-    text_files = glob.glob(expr)
+    with os.scandir(directory) as entries:
+        text_files = [entry.path for entry in entries if entry.is_file() and entry.name.endswith(".txt")]
 
     for text in text_files:
         with open(text) as open_txt_file:
@@ -81,7 +79,7 @@ def clear_directory(directory, safe=False):
                 continue
 
         if safe:
-            answer = raw_input("Would you like to delete {}? y".format(text))
+            answer = input("Would you like to delete {}? y".format(text))
             os.remove(text) if answer == "y" else None
         else:
             os.remove(text)
@@ -104,15 +102,34 @@ def find_all_knob_names(recursive=False):
     # inside groups nodes
     import nuke
 
-    for node in nuke.allNodes(recurseGroups=recursive):
-        for knob in node.allKnobs():
-            name = knob.name()
+    # Gather the nodes under the root context, regardless of the group the
+    # user is currently in, then leave the context before yielding
+    with nuke.root():
+        nodes = nuke.allNodes(recurseGroups=recursive)
+
+    for node in nodes:
+        # The knobs dictionary keys are already the knob names
+        for name in node.knobs():
             if not name:
                 continue
 
             yield name
 
 
+def count_knob_names(recursive=False):
+    """
+    Count the knob names in the script directly, skipping the text file
+    round trip.
+
+    Keyword Arg:
+        recursive(bool):        Gather all nodes, defaults to False
+
+    Returns:
+        (obj) Dictionary with key as name, and value of count
+    """
+    return Counter(find_all_knob_names(recursive=recursive))
+
+
 def knob_name_count(text):
     """
     Count the names in the text file, and return a dictionary with
@@ -128,22 +145,13 @@ def knob_name_count(text):
     Returns:
         (obj) Dictionary with key as name, and value of count
     """
-    count = defaultdict(int)
     if not os.path.exists(text):
         raise OSError("Path doesn't exist, please provide a valid path.")
 
-    # Gather the data and close the file object to avoid file lock.
+    # Skip the first line which is file verifier, read and close the file
+    # object to avoid file lock.
     with open(text, "r") as open_text_file:
-        open_text_file.seek(1)
-        data = open_text_file.read().splitlines()
-
-    for i, line in enumerate(data):
-        # Skip the first line which is file verifier
-        if i == 0:
-            continue
-        count[line] += 1
-
-    return count
+        return Counter(line.rstrip("\n") for line in islice(open_text_file, 1, None))
 
 
 def write_to_text(names, dirname, basename=None):
@@ -176,29 +184,25 @@ def write_to_text(names, dirname, basename=None):
     _mkdir(dirname)
 
     # In the case there are empty list items
-    names = [__SIGNATURE] + [name for name in sorted(names) if name]
-    names = "\n".join(names)
+    names = sorted(name for name in names if name)
     text = os.path.join(dirname, basename)
     with open(text, "w") as open_text_file:
-        open_text_file.write(names)
+        open_text_file.write(__SIGNATURE + "\n")
+        open_text_file.writelines(name + "\n" for name in names)
 
     return text
 
 
-def test():
-    """
-    Providing a testing function, which will print the data required
+def test(limit=50):
     """
-    dirname = os.getenv("HOME")
-    dirname = os.path.join(dirname, "testing")
+    Providing a testing function, which will print the data required. The
+    names are counted in-process, use write_to_text to persist them.
 
-    names = find_all_knob_names()
-    text = write_to_text(names, dirname=dirname, basename="scanline-test")
-
-    for key, item in knob_name_count(text).iteritems():
-        print key, item
-
-    clear_directory(dirname, safe=False)
+    Keyword Args:
+        limit(int):         Number of most common names to print, default to 50
+    """
+    for key, item in count_knob_names().most_common(limit):
+        print(key, item)
 
 
 if __name__ == '__main__':
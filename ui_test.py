@@ -25,11 +25,7 @@ def all_classes():
     Returns:
         (set) Sorted class names
     """
-    classes = set()
-    for node in nuke.allNodes():
-        classes.add(node.Class())
-
-    return sorted(classes)
+    return sorted({node.Class() for node in nuke.allNodes()})
 
 
 def all_class_knobs(cls):
@@ -42,10 +38,25 @@ def all_class_knobs(cls):
     Returns:
         (list) Sorted knob names
     """
-    for node in nuke.allNodes(cls):
-        return sorted([name for name, item in node.knobs().items()])
+    return gather_class_knobs(nuke.allNodes(cls)).get(cls, [])
+
 
-    return []
+def gather_class_knobs(nodes):
+    """
+    Group the knob names of the nodes by class in a single pass, knob
+    names are gathered across all nodes of the class.
+
+    Args:
+        nodes(list):    Nuke nodes
+
+    Returns:
+        (dict) Class name with the sorted knob names
+    """
+    class_to_knobs = dict()
+    for node in nodes:
+        class_to_knobs.setdefault(node.Class(), set()).update(node.knobs())
+
+    return {cls: sorted(knobs) for cls, knobs in class_to_knobs.items()}
 
 
 def filter_format(attr):
@@ -62,13 +73,18 @@ def filter_format(attr):
     Returns:
         (str) Name from the nuke format
     """
-    if not attr.isdigit():
+    try:
+        index = int(attr)
+    except ValueError:
         raise TypeError("Please provide an int value!")
 
-    if int(attr) == 0:
+    if index < 0:
+        raise TypeError("Please provide a positive int value!")
+
+    if index == 0:
         return nuke.root().format().name()
 
-    nuke_format = nuke.formats()[int(attr)-1]
+    nuke_format = nuke.formats()[index-1]
     return nuke_format.name()
 
 
@@ -82,15 +98,18 @@ def is_int_or_str(attr):
     Returns:
         (int|str)
     """
-    if attr.isdigit():
+    try:
         return int(attr)
-
-    return str(attr)
+    except (ValueError, TypeError):
+        return str(attr)
 
 
 def is_int(attr):
     """ Validate if int, else return True. """
-    return int(attr) if attr.isdigit() else 1
+    try:
+        return int(attr)
+    except (ValueError, TypeError):
+        return 1
 
 
 class CustomLineEdit(QtWidgets.QLineEdit):
@@ -112,8 +131,33 @@ class CustomLineEdit(QtWidgets.QLineEdit):
         super(CustomLineEdit, self).__init__()
         self.populate = populate
         self.items = list()
-        # Populate if you can on init
-        self.mousePressEvent()
+        # Populate if you can on init, without popping up the completer
+        self._refresh_items(show_popup=False)
+
+    def _refresh_items(self, show_popup=False):
+        """
+        Private method, update the completer from the populate function.
+
+        Keyword Args:
+            show_popup(bool):     Pop up the completer, default to False
+        """
+        # Set the list of string from the populate function, list of classes or knobs
+        items = self.populate()
+        # Create and set the completer, only when the items have changed
+        if self.completer() is None or items != self.items:
+            self.items = items
+            completer = QtWidgets.QCompleter(self.items)
+            completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+            self.setCompleter(completer)
+
+        if not show_popup:
+            return None
+
+        self.completer().setCompletionPrefix(self.text() or "")
+        # Pop up the completer
+        self.completer().complete()
+
+        return None
 
     def mousePressEvent(self, *args, **kwargs):
         """
@@ -122,15 +166,7 @@ class CustomLineEdit(QtWidgets.QLineEdit):
         """
         # Select the input, making it easier to remove/override the input text
         self.selectAll()
-        # Set the list of string from the populate function, list of classes or knobs
-        self.items = self.populate()
-        # Create and set the completer
-        completer = QtWidgets.QCompleter(self.items)
-        completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.setCompleter(completer)
-        self.completer().setCompletionPrefix(self.text() or "")
-        # Pop up the completer
-        self.completer().complete()
+        self._refresh_items(show_popup=True)
 
         return None
 
@@ -154,7 +190,7 @@ class GatherAndSet(QtWidgets.QDialog):
             "Array_Knob": float,
             "Disable_Knob": is_int,
         }
-    __PATTERN = re.compile(r"[\w.]+")
+    __PATTERN = re.compile(r"[\w.]+", re.ASCII)
 
     def __init__(self, parent=None):
         """
@@ -164,6 +200,7 @@ class GatherAndSet(QtWidgets.QDialog):
             parent(object):        Parent QWidget, or app application
         """
         super(GatherAndSet, self).__init__(parent or QtWidgets.QApplication.activeWindow())
+        self.refresh()
         self.setContentsMargins(*([5]*4))
         self.setLayout(self.master_layout())
         self.connection()
@@ -194,6 +231,17 @@ class GatherAndSet(QtWidgets.QDialog):
         """ (str) User input value. """
         return self.value_lineedit.text()
 
+    def refresh(self):
+        """
+        Gather the class names and their sorted knob names in a single pass
+        over the script, the dropdowns read from this cache until the next
+        refresh.
+        """
+        self._class_to_knobs = gather_class_knobs(nuke.allNodes())
+        self._classes = sorted(self._class_to_knobs)
+
+        return None
+
     def base_layout(self):
         """
         Creating the class, knob, and input value line edits, adding the
@@ -202,10 +250,10 @@ class GatherAndSet(QtWidgets.QDialog):
         Returns:
             (QtWidgets.QGridLayout)
         """
-        self.class_dropdown = CustomLineEdit(all_classes)
+        self.class_dropdown = CustomLineEdit(lambda: self._classes)
         self.class_dropdown.setPlaceholderText("Selected Node Class!")
 
-        self.knob_dropdown = CustomLineEdit(lambda: all_class_knobs(self.class_dropdown.text()))
+        self.knob_dropdown = CustomLineEdit(lambda: self._class_to_knobs.get(self.class_dropdown.text(), []))
         self.knob_dropdown.setPlaceholderText("Selected Class knob!")
 
         self.value_lineedit = QtWidgets.QLineEdit()
@@ -270,40 +318,84 @@ class GatherAndSet(QtWidgets.QDialog):
 
         return layout
 
-    def _update_knob_value(self):
+    def _knob_value(self, knob_class, array, value, tokens):
         """
-        Private method, loop through the class nodes, pass the value through
-        a custom type operation. Also verify the array count to ensure the
-        set operation is complete without error.
+        Private method, pass the value through the custom type operation of
+        the knob class, and verify the array count to ensure the set
+        operation is complete without error.
+
+        Args:
+            knob_class(str):    Knob class name
+            array(int):         Knob array size
+            value(str):         User input value
+            tokens(list):       Values parsed from the user input
 
         Raises:
             TypeError:      Array doesnt match
+
+        Returns:
+            Value to set on the knob
         """
-        for node in nuke.allNodes(self.class_name):
-            knob = node.knob(self.knob_name)
-            knob_type = self.__KNOB_TYPES.get(knob.Class(), str)
+        knob_type = self.__KNOB_TYPES.get(knob_class, str)
 
-            # Check if knob has an array
-            if not hasattr(knob, "arraySize"):
-                knob.setValue(knob_type(self.value))
-                continue
+        # If the Array is one then use the default value and not the
+        # list of values from the rege
+        if array == 1:
+            return knob_type(value)
 
-            array = knob.arraySize()
-            value = [knob_type(v) for v in self.__PATTERN.findall(self.value)]
+        # If we entered one value but the knob required for than one array
+        if len(tokens) == 1:
+            return [knob_type(value)] * array
 
-            # If the Array is one then use the default value and not the
-            # list of values from the rege
-            if array == 1:
-                value = knob_type(self.value)
+        if array != len(tokens):
+            raise TypeError("Array doesnt match! Expected array length of {}, {} provided!".format(array, len(tokens)))
 
-            # If we entered one value but the knob required for than one array
-            elif len(value) != array and len(value) == 1:
-                value = [knob_type(self.value)] * array
+        return [knob_type(v) for v in tokens]
 
-            elif array != len(value):
-                raise TypeError("Array doesnt match! Expected array length of {}, {} provided!".format(array, len(value)))
+    def _update_knob_value(self):
+        """
+        Private method, loop through the class nodes, pass the value through
+        a custom type operation. Also verify the array count to ensure the
+        set operation is complete without error.
 
-            knob.setValue(value)
+        Raises:
+            TypeError:      Array doesnt match
+            ValueError:     No class node has the knob
+        """
+        knob_name = self.knob_name
+        value = self.value
+        # The user value is the same for every knob, parse it once
+        tokens = self.__PATTERN.findall(value)
+
+        # Walk the DAG once, only keeping the knobs that exist. Since the knob
+        # list is gathered across the class, user knobs might not exist on
+        # every node.
+        knobs = [node.knob(knob_name) for node in nuke.allNodes(self.class_name)]
+        knobs = [knob for knob in knobs if knob is not None]
+
+        if not knobs:
+            raise ValueError("No {} node has the knob {}!".format(self.class_name, knob_name))
+
+        # User knobs with the same name can differ in type or array size
+        # between nodes, group them and build the value once per group.
+        groups = dict()
+        for knob in knobs:
+            array = knob.arraySize() if hasattr(knob, "arraySize") else 1
+            groups.setdefault((knob.Class(), array), []).append(knob)
+
+        # Validate every group before setting anything
+        values = [(self._knob_value(knob_class, array, value, tokens), group)
+                  for (knob_class, array), group in groups.items()]
+
+        # Group the set operations into a single undo step
+        undo = nuke.Undo()
+        undo.begin("Gather and Set")
+        try:
+            for knob_value, group in values:
+                for knob in group:
+                    knob.setValue(knob_value)
+        finally:
+            undo.end()
 
         return True
 
@@ -328,7 +420,7 @@ class GatherAndSet(QtWidgets.QDialog):
         try:
             self._update_knob_value()
         except Exception as e:
-            QtWidgets.QMessageBox(self, text=e.message.title(), icon=QtWidgets.QMessageBox.Information).exec_()
+            QtWidgets.QMessageBox(self, text=str(e), icon=QtWidgets.QMessageBox.Information).exec_()
             return False
 
         return True